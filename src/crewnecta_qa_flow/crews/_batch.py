@@ -0,0 +1,48 @@
+"""Concurrent fan-out of one crew over many inputs.
+
+The risk-scoring, QA and coaching steps each run one crew over a batch of
+inputs. The crew is built once and copied per input (the same thing
+``kickoff_for_each_async`` does), so config loading and agent/task wiring
+are not repeated. ``Agent.copy()`` drops MCP servers, so crews that use one
+are rebuilt per input instead.
+
+Concurrency is bounded by the shared scheduler ``limiter`` that every
+kickoff already goes through; there is no second, per-batch bound here.
+"""
+
+import asyncio
+from typing import Callable
+
+from crewai import Crew
+
+from crewnecta_qa_flow.crews._cache import kickoff_cached_async
+from crewnecta_qa_flow.crews._scheduler import limiter
+
+
+async def kickoff_batch(
+    build_crew: Callable[[], Crew],
+    inputs_list: list[dict],
+    base_crew: Crew | None = None,
+    rebuild_per_input: bool = False,
+    max_concurrency: int | None = None,
+) -> list:
+    """Kick off a crew once per input, concurrently.
+
+    ``base_crew`` lets callers reuse one built crew across batches;
+    ``rebuild_per_input`` builds a fresh crew for every input instead of
+    copying. ``max_concurrency`` overrides QA_MAX_CONCURRENCY for the
+    running event loop. Results are returned in input order; a failed
+    kickoff is returned as its exception.
+    """
+    if max_concurrency:
+        limiter.set_loop_concurrency(max_concurrency)
+    if not rebuild_per_input:
+        base_crew = base_crew or build_crew()
+
+    def _crew_for_input() -> Crew:
+        return build_crew() if rebuild_per_input else base_crew.copy()
+
+    return await asyncio.gather(
+        *(kickoff_cached_async(_crew_for_input(), inputs) for inputs in inputs_list),
+        return_exceptions=True,
+    )
@@ -0,0 +1,227 @@
+"""Exact-match response cache shared by all four crews.
+
+Crew kickoffs are keyed on a SHA-256 of everything that determines the LLM
+conversation: each agent's model, temperature and role/goal/backstory, each
+task's description template and expected output, and the kickoff inputs.
+Re-runs, retries and backfills over the same transcripts then return the
+stored output instead of paying for identical tokens again.
+
+Two tiers: a bounded in-process LRU in front of a persistent SQLite file.
+Entries expire after QA_RESPONSE_CACHE_TTL seconds (default 7 days) and are
+dropped when found expired. Replies that CrewAI could not convert to the
+task's output model are not cached, so the next run asks again. Set
+QA_RESPONSE_CACHE=0 to disable. Inside ``fresh_responses()`` lookups are
+skipped, so every kickoff asks the model again (and refreshes its entry).
+
+Async kickoffs are also coalesced: while one kickoff for a key is running,
+identical concurrent kickoffs on the same event loop (e.g. a retry storm on
+the same transcript) await its result instead of starting their own LLM
+calls. Futures are tracked per loop, because each flow step and each UI
+session runs its own loop and a future cannot be awaited from another.
+"""
+
+import asyncio
+import contextlib
+import contextvars
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from collections import OrderedDict
+
+from crewai import Crew
+from crewai.crews.crew_output import CrewOutput
+
+from crewnecta_qa_flow.crews._scheduler import run_scheduled
+
+
+CACHE_ENABLED = os.getenv("QA_RESPONSE_CACHE", "1") != "0"
+CACHE_PATH = os.getenv("QA_RESPONSE_CACHE_PATH", ".qa_cache/responses.sqlite")
+CACHE_TTL_SECONDS = int(os.getenv("QA_RESPONSE_CACHE_TTL", str(7 * 24 * 3600)))
+
+# The in-process tier is an LRU so a long-running UI process stays bounded
+MEMORY_MAX_ENTRIES = 4096
+
+_memory: OrderedDict[str, tuple[float, str, dict | None]] = OrderedDict()
+_lock = threading.Lock()
+# Set by fresh_responses(); copied into the event loops and worker threads
+# a flow run starts, so it reaches every kickoff of that run
+_skip_lookup: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "qa_response_cache_skip_lookup", default=False
+)
+# event loop -> {cache key: future of the kickoff running on that loop}
+_inflight: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _connect() -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(CACHE_PATH) or ".", exist_ok=True)
+    conn = sqlite3.connect(CACHE_PATH)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        " key TEXT PRIMARY KEY, created REAL, raw TEXT, pydantic TEXT)"
+    )
+    return conn
+
+
+def cache_key(crew: Crew, inputs: dict) -> str:
+    """Hash the static prompt material plus inputs of a crew kickoff."""
+    payload = {
+        "agents": [
+            [
+                getattr(a.llm, "model", str(a.llm)),
+                getattr(a.llm, "temperature", None),
+                a.role,
+                a.goal,
+                a.backstory,
+            ]
+            for a in crew.agents
+        ],
+        "tasks": [
+            [t._original_description or t.description,
+             t._original_expected_output or t.expected_output]
+            for t in crew.tasks
+        ],
+        "inputs": inputs,
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _output_model(crew: Crew):
+    """The final task's ``output_pydantic`` class, if it has one."""
+    return crew.tasks[-1].output_pydantic if crew.tasks else None
+
+
+def _remember(key: str, entry: tuple[float, str, dict | None]) -> None:
+    # Caller holds _lock
+    _memory[key] = entry
+    _memory.move_to_end(key)
+    while len(_memory) > MEMORY_MAX_ENTRIES:
+        _memory.popitem(last=False)
+
+
+def _forget(key: str) -> None:
+    # Caller holds _lock
+    _memory.pop(key, None)
+    try:
+        with _connect() as conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+    except sqlite3.Error:
+        pass
+
+
+def _lookup(crew: Crew, key: str) -> CrewOutput | None:
+    model_cls = _output_model(crew)
+    now = time.time()
+    with _lock:
+        entry = _memory.get(key)
+        if entry is None:
+            try:
+                with _connect() as conn:
+                    row = conn.execute(
+                        "SELECT created, raw, pydantic FROM responses WHERE key = ?",
+                        (key,),
+                    ).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is None:
+                return None
+            entry = (row[0], row[1], json.loads(row[2]) if row[2] else None)
+
+        created, raw, pydantic_data = entry
+        # Expired, or a reply that never converted to the task's output model
+        # (stored before such replies were skipped): a miss, so it is re-asked
+        if now - created > CACHE_TTL_SECONDS or (model_cls and pydantic_data is None):
+            _forget(key)
+            return None
+        _remember(key, entry)
+
+    # Rehydrate into the final task's output model so callers see the same
+    # shape as a live kickoff
+    pydantic = None
+    if pydantic_data is not None and model_cls is not None:
+        try:
+            pydantic = model_cls.model_validate(pydantic_data)
+        except Exception:
+            return None
+    return CrewOutput(raw=raw, pydantic=pydantic)
+
+
+def _store(crew: Crew, key: str, result) -> None:
+    raw = getattr(result, "raw", "") or ""
+    pydantic = getattr(result, "pydantic", None)
+    if not raw and pydantic is None:
+        return
+    # CrewAI returns the raw text when it cannot convert the reply to the
+    # task's output model; caching that would replay the failure for a week
+    if pydantic is None and _output_model(crew) is not None:
+        return
+    pydantic_data = pydantic.model_dump(mode="json") if pydantic is not None else None
+    created = time.time()
+    with _lock:
+        _remember(key, (created, raw, pydantic_data))
+        try:
+            with _connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (key, created, raw,
+                     json.dumps(pydantic_data) if pydantic_data is not None else None),
+                )
+        except sqlite3.Error:
+            pass  # memory tier still serves this process
+
+
+@contextlib.contextmanager
+def fresh_responses():
+    """Within this block, kickoffs bypass cached responses (results still stored)."""
+    token = _skip_lookup.set(True)
+    try:
+        yield
+    finally:
+        _skip_lookup.reset(token)
+
+
+async def kickoff_cached_async(crew: Crew, inputs: dict):
+    """`crew.kickoff_async(inputs=...)` with the shared response cache in front.
+
+    Concurrent calls with the same key on the same event loop share one
+    in-flight kickoff.
+    """
+    key = cache_key(crew, inputs)
+    loop = asyncio.get_running_loop()
+    with _lock:
+        inflight = _inflight.setdefault(loop, {})
+        pending = inflight.get(key)
+        if pending is None:
+            future = inflight[key] = loop.create_future()
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    try:
+        result = await _kickoff_cached_async(crew, inputs, key)
+    except BaseException as exc:
+        future.set_exception(exc)
+        future.exception()  # mark retrieved when nobody else is waiting
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _lock:
+            del inflight[key]
+
+
+async def _kickoff_cached_async(crew: Crew, inputs: dict, key: str):
+    if CACHE_ENABLED and not _skip_lookup.get():
+        cached = _lookup(crew, key)
+        if cached is not None:
+            return cached
+    # Inputs size is a rough lower bound on the tokens a kickoff will spend
+    tokens = len(json.dumps(inputs, default=str)) // 4
+    result = await run_scheduled(lambda: crew.kickoff_async(inputs=inputs), tokens)
+    if CACHE_ENABLED:
+        _store(crew, key, result)
+    return result
@@ -0,0 +1,33 @@
+"""Parse-once YAML config loading for the CrewBase crews.
+
+``@CrewBase`` re-reads and re-parses agents.yaml / tasks.yaml on every crew
+instantiation, and the flow builds crews per transcript. ``cached_configs``
+swaps in a loader that parses each file once per process and hands every
+instance a deep copy, since CrewBase mutates the loaded dicts in place
+(resolving ``llm``, ``tools`` and ``agent`` names into objects).
+"""
+
+import copy
+import functools
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+
+@functools.cache
+def _parse_yaml(config_path: str) -> dict[str, Any]:
+    with open(config_path, encoding="utf-8") as file:
+        content = yaml.safe_load(file)
+    return content if isinstance(content, dict) else {}
+
+
+def load_yaml_cached(config_path: Path) -> dict[str, Any]:
+    """Drop-in for CrewBase's ``load_yaml`` backed by the parse cache."""
+    return copy.deepcopy(_parse_yaml(str(config_path)))
+
+
+def cached_configs(cls):
+    """Class decorator, applied above ``@CrewBase``, to use the parse cache."""
+    cls.load_yaml = staticmethod(load_yaml_cached)
+    return cls
@@ -0,0 +1,34 @@
+"""Shared HTTP connection pool for LLM calls made through LiteLLM.
+
+Agents call the LLM proxy many times with short prompts, so TCP/TLS setup
+is a real share of each call. Pointing LiteLLM at one process-wide httpx
+client lets every crew reuse keep-alive connections. HTTP/2 is enabled when
+the optional ``h2`` package is installed.
+
+Only the sync session is shared: ``Crew.kickoff_async`` runs the sync
+kickoff in a worker thread, and the flow runs each step's concurrency in
+its own ``asyncio.run`` loop, where a shared AsyncClient's connections
+would outlive the loop they were opened on.
+"""
+
+import importlib.util
+
+import httpx
+
+
+LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+TIMEOUT = httpx.Timeout(60.0)
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+
+def install_shared_http_clients() -> None:
+    """Install the shared client on LiteLLM unless a session is already set."""
+    try:
+        import litellm
+    except ImportError:
+        return
+
+    if litellm.client_session is None:
+        litellm.client_session = httpx.Client(
+            http2=HTTP2, limits=LIMITS, timeout=TIMEOUT
+        )
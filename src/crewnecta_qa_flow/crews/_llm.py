@@ -0,0 +1,55 @@
+"""LLM selection helpers for the agents: prefix caching and model routing.
+
+Each agent's system prompt (role, goal, backstory from agents.yaml) is
+identical on every call, and task templates keep their static rubric ahead
+of the per-transcript inputs. CrewAI already marks the end of the system
+prompt and the task prompt as cache breakpoints, which the Anthropic
+provider turns into ``cache_control`` blocks.
+
+OpenAI-compatible endpoints cache prefixes implicitly, but route requests to
+a warm cache by ``prompt_cache_key``. ``with_prompt_cache`` pins one key per
+agent role. It is opt-in (QA_PROMPT_CACHE_KEY=1) because proxies that
+forward to non-OpenAI models may reject the extra parameter.
+
+``with_light_model`` routes mechanical steps — tool-driven risk triage and
+merging pattern-analysis shards — to QA_LIGHT_MODEL when it is set, leaving
+judgement-heavy steps (QA evaluation, coaching) on the configured model.
+"""
+
+import hashlib
+import os
+
+from crewai import LLM
+
+from crewnecta_qa_flow.crews._http import install_shared_http_clients
+
+
+# Every agent factory goes through this module, so all crews share one pool
+install_shared_http_clients()
+
+PROMPT_CACHE_KEY_ENABLED = os.getenv("QA_PROMPT_CACHE_KEY", "0") == "1"
+LIGHT_MODEL = os.getenv("QA_LIGHT_MODEL", "")
+
+
+def with_light_model(agent_config: dict) -> dict:
+    """Return agent config using QA_LIGHT_MODEL, if one is configured."""
+    if not LIGHT_MODEL:
+        return agent_config
+    return {**agent_config, "llm": LIGHT_MODEL}
+
+
+def with_prompt_cache(agent_config: dict) -> dict:
+    """Return agent config whose LLM sends a per-role ``prompt_cache_key``."""
+    if not PROMPT_CACHE_KEY_ENABLED:
+        return agent_config
+
+    llm = agent_config.get("llm")
+    model = llm if isinstance(llm, str) else getattr(llm, "model", None)
+    if not model or not model.startswith("openai/"):
+        return agent_config
+
+    role_hash = hashlib.sha256(agent_config["role"].encode("utf-8")).hexdigest()[:16]
+    return {
+        **agent_config,
+        "llm": LLM(model=model, prompt_cache_key=f"crewnecta-{role_hash}"),
+    }
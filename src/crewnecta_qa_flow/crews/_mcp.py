@@ -0,0 +1,80 @@
+"""Optional MCP server configs shared by the crews (bonus integration).
+
+Configs are built once per process: the coaching and risk-scoring crews are
+rebuilt for every kickoff, and each build used to re-read credentials and
+construct a fresh MCPServerStdio. ``cache_tools_list`` lets CrewAI reuse the
+discovered tool schemas across those builds.
+
+``npx``-launched STDIO servers are slow on first launch because the package
+has to be fetched. ``warm_mcp_servers`` boots every configured server once,
+concurrently, at flow start so that cost is paid in parallel up front rather
+than serially inside the first kickoffs.
+"""
+
+import asyncio
+import functools
+import os
+
+try:
+    from crewai.mcp import MCPServerStdio
+    MCP_AVAILABLE = True
+except ImportError:
+    MCP_AVAILABLE = False
+
+
+def _stdio_server(package: str, creds_var: str) -> tuple:
+    """Return an ``npx`` STDIO server config if MCP and credentials are available."""
+    creds = os.getenv(creds_var)
+    if not (MCP_AVAILABLE and creds):
+        return ()
+    try:
+        return (
+            MCPServerStdio(
+                command="npx",
+                args=["-y", package],
+                env={creds_var: creds},
+                cache_tools_list=True,
+            ),
+        )
+    except Exception:
+        return ()
+
+
+@functools.cache
+def get_google_calendar_mcp() -> tuple:
+    """Return Google Calendar MCP config if credentials are available."""
+    return _stdio_server("@cocal/google-calendar-mcp", "GOOGLE_CALENDAR_CREDENTIALS")
+
+
+@functools.cache
+def get_google_sheets_mcp() -> tuple:
+    """Return Google Sheets MCP config if credentials are available."""
+    return _stdio_server("@anthropic/mcp-google-sheets", "GOOGLE_SHEETS_CREDENTIALS")
+
+
+async def _warm_server(config) -> None:
+    """Boot one STDIO server, list its tools (filling the cache), shut it down."""
+    from crewai.mcp.client import MCPClient
+    from crewai.mcp.transports.stdio import StdioTransport
+
+    client = MCPClient(
+        transport=StdioTransport(
+            command=config.command, args=config.args, env=config.env
+        ),
+        cache_tools_list=True,
+    )
+    try:
+        await client.connect()
+        await client.list_tools()
+    finally:
+        if client.connected:
+            await client.disconnect()
+
+
+async def warm_mcp_servers() -> None:
+    """Boot all configured MCP servers concurrently; failures are ignored."""
+    configs = get_google_calendar_mcp() + get_google_sheets_mcp()
+    if configs:
+        await asyncio.gather(
+            *(_warm_server(c) for c in configs), return_exceptions=True
+        )
@@ -0,0 +1,134 @@
+"""Shared concurrency and rate-limit scheduler for async crew kickoffs.
+
+CrewAI's per-agent ``max_rpm`` only throttles a single crew; once kickoffs
+run concurrently they share the provider's RPM/TPM budget. Every async
+kickoff goes through the ``limiter`` here:
+
+* at most QA_MAX_CONCURRENCY kickoffs run at once per event loop
+  (default 4). The flow runs each step in its own ``asyncio.run`` loop and
+  every UI session runs its own flow, so N concurrent audits can have up
+  to N x QA_MAX_CONCURRENCY kickoffs in flight;
+* token buckets cap request and token starts at QA_RPM / QA_TPM per minute
+  across the whole process (0, the default, leaves that bucket unlimited);
+* a kickoff that fails on a provider rate limit is retried with exponential
+  backoff and jitter, re-entering the queue each time.
+
+Bucket state is guarded by a thread lock rather than asyncio primitives so
+it can be shared by all those event loops.
+"""
+
+import asyncio
+import contextlib
+import os
+import random
+import threading
+import time
+import weakref
+from typing import Awaitable, Callable, TypeVar
+
+
+MAX_CONCURRENCY = int(os.getenv("QA_MAX_CONCURRENCY", "4"))
+RPM_LIMIT = int(os.getenv("QA_RPM", "0"))
+TPM_LIMIT = int(os.getenv("QA_TPM", "0"))
+MAX_RETRIES = int(os.getenv("QA_RATE_LIMIT_RETRIES", "5"))
+
+T = TypeVar("T")
+
+
+class _TokenBucket:
+    """Refills ``per_minute`` units over a minute; capacity is one minute's worth."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` is available (0 if it is available now)."""
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        # A single request larger than the bucket is let through once it is full
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self.level) / self.rate)
+
+    def charge(self, amount: float) -> None:
+        self.level -= min(amount, self.capacity)
+
+
+class AsyncRateLimiter:
+    """Bounded-concurrency, RPM/TPM-aware gate for async provider calls."""
+
+    def __init__(self, rpm: int = 0, tpm: int = 0, max_concurrency: int = MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self._rpm = _TokenBucket(rpm) if rpm > 0 else None
+        self._tpm = _TokenBucket(tpm) if tpm > 0 else None
+        self._lock = threading.Lock()
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.max_concurrency)
+                self._semaphores[loop] = semaphore
+            return semaphore
+
+    def set_loop_concurrency(self, max_concurrency: int) -> None:
+        """Bound kickoffs on the running event loop at ``max_concurrency``.
+
+        Call before the loop takes its first slot; other loops keep the
+        default bound.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._semaphores[loop] = asyncio.Semaphore(max_concurrency)
+
+    async def _wait_for_budget(self, tokens: int) -> None:
+        buckets = [(b, n) for b, n in ((self._rpm, 1), (self._tpm, tokens)) if b and n]
+        while True:
+            with self._lock:
+                wait = max((b.wait_time(n) for b, n in buckets), default=0.0)
+                # Charge only when every bucket can pay, so waits never double-count
+                if not wait:
+                    for bucket, amount in buckets:
+                        bucket.charge(amount)
+                    return
+            await asyncio.sleep(wait)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, tokens: int = 0):
+        """Hold one concurrency slot after paying one request and ``tokens``."""
+        async with self._semaphore():
+            await self._wait_for_budget(tokens)
+            yield
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """True if ``exc`` or anything in its cause chain is a provider 429."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        if type(exc).__name__ == "RateLimitError" or getattr(exc, "status_code", None) == 429:
+            return True
+        exc = exc.__cause__ or exc.__context__
+    return False
+
+
+limiter = AsyncRateLimiter(rpm=RPM_LIMIT, tpm=TPM_LIMIT)
+
+
+async def run_scheduled(call: Callable[[], Awaitable[T]], tokens: int = 0) -> T:
+    """Await ``call()`` inside a limiter slot, backing off on rate limits."""
+    for attempt in range(MAX_RETRIES + 1):
+        async with limiter.slot(tokens):
+            try:
+                return await call()
+            except Exception as exc:
+                if attempt == MAX_RETRIES or not is_rate_limit_error(exc):
+                    raise
+        # Back off outside the slot so other work can use it meanwhile
+        await asyncio.sleep(min(60.0, 2 ** attempt) * random.uniform(0.5, 1.0))
+    raise AssertionError("unreachable")
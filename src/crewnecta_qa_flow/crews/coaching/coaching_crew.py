@@ -1,33 +1,19 @@
 """Coaching Crew — generates a personalized coaching plan for one agent."""
 
-import os
 from typing import List
 
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 
+from crewnecta_qa_flow.crews._batch import kickoff_batch
+from crewnecta_qa_flow.crews._config import cached_configs
+from crewnecta_qa_flow.crews._llm import with_prompt_cache
+from crewnecta_qa_flow.crews._mcp import get_google_calendar_mcp
 from crewnecta_qa_flow.state.models import CoachingPlan
 
 
-def _get_google_calendar_mcp() -> list:
-    """Return Google Calendar MCP config if credentials are available."""
-    creds = os.getenv("GOOGLE_CALENDAR_CREDENTIALS")
-    if not creds:
-        return []
-    try:
-        from crewai.mcp import MCPServerStdio
-        return [
-            MCPServerStdio(
-                command="npx",
-                args=["-y", "@cocal/google-calendar-mcp"],
-                env={"GOOGLE_CALENDAR_CREDENTIALS": creds},
-            )
-        ]
-    except Exception:
-        return []
-
-
+@cached_configs
 @CrewBase
 class CoachingCrew:
     """Coaching crew — one agent creates one coaching plan."""
@@ -37,10 +23,10 @@ class CoachingCrew:
 
     @agent
     def coaching_architect(self) -> Agent:
-        mcps = _get_google_calendar_mcp()
+        mcps = get_google_calendar_mcp()
         return Agent(
-            config=self.agents_config["coaching_architect"],
-            **({"mcps": mcps} if mcps else {}),
+            config=with_prompt_cache(self.agents_config["coaching_architect"]),
+            **({"mcps": list(mcps)} if mcps else {}),
         )
 
     @task
@@ -59,3 +45,23 @@ class CoachingCrew:
             process=Process.sequential,
             verbose=True,
         )
+
+
+async def run_batch_async(
+    inputs_list: list[dict],
+    max_concurrency: int | None = None,
+    base_crew: Crew | None = None,
+) -> list:
+    """Generate coaching plans for many agents concurrently.
+
+    The crew is built once and copied per agent, except when the calendar
+    MCP is configured (``Agent.copy()`` drops MCP servers, so each agent
+    then gets a fresh build). See ``kickoff_batch``.
+    """
+    return await kickoff_batch(
+        lambda: CoachingCrew().crew(),
+        inputs_list,
+        base_crew=base_crew,
+        rebuild_per_input=bool(get_google_calendar_mcp()),
+        max_concurrency=max_concurrency,
+    )
@@ -1,14 +1,43 @@
-"""Pattern Analysis Crew — analyzes all evaluations for cross-agent patterns."""
+"""Pattern Analysis Crew — analyzes all evaluations for cross-agent patterns.
 
-from typing import List
+Small batches go through a single analysis task. Larger batches are split
+into shards that are analyzed concurrently (map), then merged by a reducer
+task into one PatternInsightsOutput (reduce).
+
+Pattern analysis is latency-tolerant, so with QA_PATTERN_MODE=batch the
+shard prompts are submitted through the OpenAI-compatible Batch API at
+batch pricing instead of as online calls. Shards the batch does not deliver
+(failed requests, a failed/expired/cancelled batch, or one still running
+after QA_BATCH_MAX_WAIT_SECONDS) are re-run online, and the reducer always
+runs online.
+"""
+
+import asyncio
+import io
+import json
+import os
+import time
+from typing import List, Literal
 
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 
+from crewnecta_qa_flow.crews._cache import kickoff_cached_async
+from crewnecta_qa_flow.crews._config import cached_configs
+from crewnecta_qa_flow.crews._llm import with_light_model, with_prompt_cache
 from crewnecta_qa_flow.state.models import PatternInsightsOutput
 
 
+# Evaluations per shard; batches at or below this size skip map-reduce
+SHARD_SIZE = int(os.getenv("QA_PATTERN_SHARD_SIZE", "25"))
+PATTERN_MODE = os.getenv("QA_PATTERN_MODE", "online")
+BATCH_POLL_SECONDS = int(os.getenv("QA_BATCH_POLL_SECONDS", "30"))
+# Longest a flow step waits on a batch before running its shards online
+BATCH_MAX_WAIT_SECONDS = int(os.getenv("QA_BATCH_MAX_WAIT_SECONDS", "3600"))
+
+
+@cached_configs
 @CrewBase
 class PatternAnalysisCrew:
     """Pattern analysis crew — one agent reviews all evaluations."""
@@ -19,7 +48,7 @@ class PatternAnalysisCrew:
     @agent
     def pattern_analyst(self) -> Agent:
         return Agent(
-            config=self.agents_config["pattern_analyst"],
+            config=with_prompt_cache(self.agents_config["pattern_analyst"]),
         )
 
     @task
@@ -38,3 +67,191 @@ class PatternAnalysisCrew:
             process=Process.sequential,
             verbose=True,
         )
+
+    # Map-reduce crews are built directly (not via @task) so they stay out
+    # of the default single-task crew above.
+    def shard_crew(self) -> Crew:
+        return Crew(
+            agents=[self.pattern_analyst()],
+            tasks=[
+                Task(
+                    config=self.tasks_config["pattern_analysis_shard_task"],
+                    agent=self.pattern_analyst(),
+                    output_pydantic=PatternInsightsOutput,
+                )
+            ],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    def reduce_crew(self) -> Crew:
+        # Merging shard outputs is mechanical, so it may run on the light model
+        reducer = Agent(
+            config=with_prompt_cache(with_light_model(self.agents_config["pattern_analyst"])),
+        )
+        return Crew(
+            agents=[reducer],
+            tasks=[
+                Task(
+                    config=self.tasks_config["pattern_analysis_reduce_task"],
+                    agent=reducer,
+                    output_pydantic=PatternInsightsOutput,
+                )
+            ],
+            process=Process.sequential,
+            verbose=True,
+        )
+
+    async def run(
+        self,
+        campaign_name: str,
+        evaluation_period: str,
+        evaluation_lines: list[str],
+        mode: Literal["online", "batch"] | None = None,
+    ):
+        """Analyze evaluation summary lines, sharding large batches.
+
+        Returns the CrewOutput of the single-task crew, or of the reducer
+        crew when the batch was sharded. ``mode`` (default QA_PATTERN_MODE)
+        selects how shards are run; it has no effect on unsharded batches.
+        """
+        mode = mode or PATTERN_MODE
+        base_inputs = {
+            "campaign_name": campaign_name,
+            "evaluation_period": evaluation_period,
+        }
+
+        if len(evaluation_lines) <= SHARD_SIZE:
+            return await kickoff_cached_async(
+                self.crew(),
+                {**base_inputs, "evaluations_summary": "\n".join(evaluation_lines)},
+            )
+
+        shards = [
+            evaluation_lines[i:i + SHARD_SIZE]
+            for i in range(0, len(evaluation_lines), SHARD_SIZE)
+        ]
+        if mode == "batch":
+            shard_outputs = await asyncio.to_thread(
+                self._run_shards_batch, base_inputs, shards
+            )
+        else:
+            shard_outputs = [None] * len(shards)
+
+        # Online mode runs every shard here; batch mode only the shards whose
+        # batch request failed, so no shard's evaluations drop out silently
+        missing = [i for i, output in enumerate(shard_outputs) if output is None]
+        if missing:
+            # One crew instance per shard — crews are not safe to run concurrently
+            shard_results = await asyncio.gather(*(
+                kickoff_cached_async(
+                    PatternAnalysisCrew().shard_crew(),
+                    {**base_inputs, "shard_evaluations": "\n".join(shards[i])},
+                )
+                for i in missing
+            ))
+            for i, r in zip(missing, shard_results):
+                shard_outputs[i] = r.pydantic.model_dump_json() if r.pydantic else r.raw
+
+        shard_insights = "\n\n".join(
+            f"--- Subset {i} of {len(shards)} ---\n{output}"
+            for i, output in enumerate(shard_outputs, 1)
+        )
+        return await kickoff_cached_async(
+            self.reduce_crew(),
+            {**base_inputs, "shard_insights": shard_insights},
+        )
+
+    def _run_shards_batch(
+        self, base_inputs: dict, shards: list[list[str]]
+    ) -> list[str | None]:
+        """Run shard prompts through the Batch API; returns raw JSON per shard.
+
+        Shards without a usable reply are returned as None: requests that
+        failed (error file, no output line, non-200 response, empty reply),
+        and every request of a batch that failed, expired or was cancelled
+        before finishing it, or outlasted QA_BATCH_MAX_WAIT_SECONDS.
+
+        The pattern analyst has no tools, so each shard is one chat
+        completion: the agent's role/goal/backstory as the system prompt and
+        the interpolated shard task as the user prompt.
+        """
+        from openai import OpenAI
+
+        agent_cfg = self.agents_config["pattern_analyst"]
+        task_cfg = self.tasks_config["pattern_analysis_shard_task"]
+        llm = agent_cfg.get("llm")
+        model = llm if isinstance(llm, str) else llm.model
+        model = model.split("/", 1)[-1]  # drop the LiteLLM provider prefix
+
+        system_prompt = (
+            f"You are {agent_cfg['role']}. {agent_cfg['backstory']}\n"
+            f"Your personal goal is: {agent_cfg['goal']}"
+        )
+        schema = json.dumps(PatternInsightsOutput.model_json_schema())
+
+        lines = []
+        for i, shard in enumerate(shards):
+            user_prompt = task_cfg["description"]
+            for name, value in {**base_inputs, "shard_evaluations": "\n".join(shard)}.items():
+                user_prompt = user_prompt.replace("{" + name + "}", value)
+            user_prompt += (
+                f"\n\nExpected output: {task_cfg['expected_output']}\n"
+                f"Respond with a single JSON object matching this schema:\n{schema}"
+            )
+            lines.append(json.dumps({
+                "custom_id": f"shard-{i}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    "response_format": {"type": "json_object"},
+                },
+            }))
+
+        client = OpenAI(base_url=os.getenv("OPENAI_API_BASE") or None)
+        batch_file = client.files.create(
+            file=("pattern_shards.jsonl", io.BytesIO("\n".join(lines).encode("utf-8"))),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        deadline = time.monotonic() + BATCH_MAX_WAIT_SECONDS
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if time.monotonic() >= deadline:
+                # Stop paying for the batch; the unfinished shards run online
+                try:
+                    batch = client.batches.cancel(batch.id)
+                except Exception:
+                    pass
+                break
+            time.sleep(BATCH_POLL_SECONDS)
+            batch = client.batches.retrieve(batch.id)
+
+        # Expired and cancelled batches still deliver the requests that
+        # finished; a failed one (or one with every request failed) has no
+        # output file, so every shard is re-run online
+        outputs: dict[str, str] = {}
+        output_text = (
+            client.files.content(batch.output_file_id).text if batch.output_file_id else ""
+        )
+        for line in output_text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                continue
+            choices = (response.get("body") or {}).get("choices") or [{}]
+            content = (choices[0].get("message") or {}).get("content")
+            if content:
+                outputs[record["custom_id"]] = content
+
+        return [outputs.get(f"shard-{i}") for i in range(len(shards))]
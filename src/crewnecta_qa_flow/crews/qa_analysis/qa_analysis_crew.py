@@ -6,10 +6,14 @@ from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 
+from crewnecta_qa_flow.crews._batch import kickoff_batch
+from crewnecta_qa_flow.crews._config import cached_configs
+from crewnecta_qa_flow.crews._llm import with_prompt_cache
 from crewnecta_qa_flow.tools import compliance_pattern_matcher, scorecard_calculator
 from crewnecta_qa_flow.state.models import QAEvaluationOutput
 
 
+@cached_configs
 @CrewBase
 class QAAnalysisCrew:
     """QA analysis crew — two agents analyze one transcript sequentially."""
@@ -20,14 +24,14 @@ class QAAnalysisCrew:
     @agent
     def compliance_auditor(self) -> Agent:
         return Agent(
-            config=self.agents_config["compliance_auditor"],
+            config=with_prompt_cache(self.agents_config["compliance_auditor"]),
             tools=[compliance_pattern_matcher],
         )
 
     @agent
     def quality_evaluator(self) -> Agent:
         return Agent(
-            config=self.agents_config["quality_evaluator"],
+            config=with_prompt_cache(self.agents_config["quality_evaluator"]),
             tools=[scorecard_calculator],
         )
 
@@ -55,3 +59,21 @@ class QAAnalysisCrew:
             process=Process.sequential,
             verbose=True,
         )
+
+
+async def kickoff_many(
+    inputs_list: list[dict],
+    max_concurrency: int | None = None,
+    base_crew: Crew | None = None,
+) -> list:
+    """Run the QA crew over many transcripts concurrently.
+
+    The crew is built once and copied per transcript; the compliance ->
+    quality handoff stays sequential inside each copy. See ``kickoff_batch``.
+    """
+    return await kickoff_batch(
+        lambda: QAAnalysisCrew().crew(),
+        inputs_list,
+        base_crew=base_crew,
+        max_concurrency=max_concurrency,
+    )
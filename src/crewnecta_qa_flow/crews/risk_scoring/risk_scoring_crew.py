@@ -1,34 +1,20 @@
 """Risk Scoring Crew — scores a single transcript for review priority."""
 
-import os
 from typing import List
 
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
 
+from crewnecta_qa_flow.crews._batch import kickoff_batch
+from crewnecta_qa_flow.crews._config import cached_configs
+from crewnecta_qa_flow.crews._llm import with_light_model, with_prompt_cache
+from crewnecta_qa_flow.crews._mcp import get_google_sheets_mcp
 from crewnecta_qa_flow.tools import keyword_red_flag_scanner
 from crewnecta_qa_flow.state.models import RiskScoreOutput
 
 
-def _get_google_sheets_mcp() -> list:
-    """Return Google Sheets MCP config if credentials are available."""
-    creds = os.getenv("GOOGLE_SHEETS_CREDENTIALS")
-    if not creds:
-        return []
-    try:
-        from crewai.mcp import MCPServerStdio
-        return [
-            MCPServerStdio(
-                command="npx",
-                args=["-y", "@anthropic/mcp-google-sheets"],
-                env={"GOOGLE_SHEETS_CREDENTIALS": creds},
-            )
-        ]
-    except Exception:
-        return []
-
-
+@cached_configs
 @CrewBase
 class RiskScoringCrew:
     """Risk scoring crew — one agent scores one transcript."""
@@ -38,11 +24,11 @@ class RiskScoringCrew:
 
     @agent
     def risk_scorer(self) -> Agent:
-        mcps = _get_google_sheets_mcp()
+        mcps = get_google_sheets_mcp()
         return Agent(
-            config=self.agents_config["risk_scorer"],
+            config=with_prompt_cache(with_light_model(self.agents_config["risk_scorer"])),
             tools=[keyword_red_flag_scanner],
-            **({"mcps": mcps} if mcps else {}),
+            **({"mcps": list(mcps)} if mcps else {}),
         )
 
     @task
@@ -61,3 +47,23 @@ class RiskScoringCrew:
             process=Process.sequential,
             verbose=True,
         )
+
+
+async def kickoff_many(
+    inputs_list: list[dict],
+    max_concurrency: int | None = None,
+    base_crew: Crew | None = None,
+) -> list:
+    """Risk-score many transcripts concurrently.
+
+    The crew is built once and copied per transcript, except when the
+    Sheets MCP is configured (``Agent.copy()`` drops MCP servers, so each
+    transcript then gets a fresh build). See ``kickoff_batch``.
+    """
+    return await kickoff_batch(
+        lambda: RiskScoringCrew().crew(),
+        inputs_list,
+        base_crew=base_crew,
+        rebuild_per_input=bool(get_google_sheets_mcp()),
+        max_concurrency=max_concurrency,
+    )
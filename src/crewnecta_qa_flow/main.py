@@ -3,55 +3,118 @@
 Loads transcripts from JSON, creates state, runs the flow, and saves results.
 """
 
-import json
+import gzip
+import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from dotenv import load_dotenv
+from pydantic import TypeAdapter, ValidationError
 
+from crewnecta_qa_flow import _json
 from crewnecta_qa_flow.state.models import InteractionTranscript, QAAuditorState
 from crewnecta_qa_flow.flow.qa_auditor_flow import QAAuditorFlow
+from crewnecta_qa_flow.tools import scan_many
+
+
+# Output files are written as bytes through a 64 KB buffer
+WRITE_BUFFER_SIZE = 64 * 1024
+# Also write the indented full_state.json next to the compact .gz copy
+PRETTY_STATE = os.getenv("QA_PRETTY_STATE", "1") != "0"
+# Batches this large are red-flag scanned across worker processes
+PARALLEL_SCAN_MIN = int(os.getenv("QA_PARALLEL_SCAN_MIN", "2000"))
+# Skip per-row validation for input files known to be well-formed
+TRUSTED_INPUT = os.getenv("QA_TRUSTED_INPUT", "0") == "1"
+
+# Validates a whole transcript list in one pydantic-core call
+_TRANSCRIPTS_ADAPTER = TypeAdapter(list[InteractionTranscript])
 
 
 def load_transcripts(path: str) -> list[InteractionTranscript]:
-    """Load transcripts from a JSON file."""
-    with open(path, "r") as f:
-        data = json.load(f)
+    """Load transcripts from a JSON file.
+
+    Rows are validated, so a missing or mistyped field fails here with a
+    ValidationError rather than mid-flow. With QA_TRUSTED_INPUT=1 (e.g. for
+    the exports this project writes itself) validation is skipped.
+    """
+    data = _json.loads(Path(path).read_bytes())
 
     raw = data.get("transcripts", data) if isinstance(data, dict) else data
-    return [InteractionTranscript(**t) for t in raw]
+    if TRUSTED_INPUT:
+        return [InteractionTranscript.model_construct(**t) for t in raw]
+    return _TRANSCRIPTS_ADAPTER.validate_python(raw)
+
+
+def scan_transcripts(transcripts: list[InteractionTranscript]) -> dict[str, dict]:
+    """Red-flag scan every transcript, keyed by interaction_id.
+
+    Scans are CPU-bound and independent, so large batches are split into
+    one chunk per core and scanned in a process pool. Small batches are
+    scanned inline, where worker start-up would cost more than it saves.
+    """
+    texts = [t.transcript_text_lower for t in transcripts]
+    channels = [t.channel for t in transcripts]
+    workers = os.cpu_count() or 1
+
+    if len(texts) < PARALLEL_SCAN_MIN or workers < 2:
+        results = scan_many(texts, channels, lowered=True)
+    else:
+        size = -(-len(texts) // workers)
+        starts = range(0, len(texts), size)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = pool.map(
+                scan_many,
+                [texts[i:i + size] for i in starts],
+                [channels[i:i + size] for i in starts],
+                [True] * len(starts),
+            )
+            results = [result for chunk in chunks for result in chunk]
+
+    return {t.interaction_id: r for t, r in zip(transcripts, results)}
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    with path.open("wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(data)
 
 
 def save_results(state: QAAuditorState, output_dir: str = "output") -> None:
     """Save the full state and reports to the output directory."""
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Full state as JSON
-    state_path = os.path.join(output_dir, "full_state.json")
-    with open(state_path, "w") as f:
-        json.dump(state.model_dump(mode="json"), f, indent=2, default=str)
-    print(f"Full state saved to {state_path}")
+    root = Path(output_dir)
+    root.mkdir(parents=True, exist_ok=True)
+
+    # Full state as JSON; orjson encodes enums natively, so the plain dump
+    # needs no JSON-mode pass
+    state_dump = state.model_dump()
+    state_path = root / "full_state.json"
+    if PRETTY_STATE:
+        _write_bytes(state_path, _json.dumps(state_dump, indent=True, default=str))
+        print(f"Full state saved to {state_path}")
+
+    # Compact gzipped copy; level 1 already shrinks the JSON several-fold
+    gz_path = root / "full_state.json.gz"
+    with gzip.open(gz_path, "wb", compresslevel=1) as f:
+        f.write(_json.dumps(state_dump, default=str))
+    print(f"Compressed state saved to {gz_path}")
 
     # Executive summary as text
     if state.executive_summary:
-        summary_path = os.path.join(output_dir, "executive_summary.txt")
-        with open(summary_path, "w") as f:
-            f.write(state.executive_summary)
+        summary_path = root / "executive_summary.txt"
+        _write_bytes(summary_path, state.executive_summary.encode("utf-8"))
         print(f"Executive summary saved to {summary_path}")
 
     # Detailed report as text
     if state.detailed_qa_report:
-        report_path = os.path.join(output_dir, "detailed_report.txt")
-        with open(report_path, "w") as f:
-            f.write(state.detailed_qa_report)
+        report_path = root / "detailed_report.txt"
+        _write_bytes(report_path, state.detailed_qa_report.encode("utf-8"))
         print(f"Detailed report saved to {report_path}")
 
     # Escalation report if present
     if state.compliance_escalation_report:
-        esc_path = os.path.join(output_dir, "compliance_escalation.txt")
-        with open(esc_path, "w") as f:
-            f.write(state.compliance_escalation_report)
+        esc_path = root / "compliance_escalation.txt"
+        _write_bytes(esc_path, state.compliance_escalation_report.encode("utf-8"))
         print(f"Escalation report saved to {esc_path}")
 
 
@@ -59,15 +122,28 @@ def main() -> None:
     """Run the QA Auditor Flow."""
     load_dotenv()
 
+    # --quiet suppresses per-step flow progress
+    args = [a for a in sys.argv[1:] if a != "--quiet"]
+    quiet = len(args) < len(sys.argv) - 1
+
+    # Flow progress is logged at INFO; show it on stdout
+    progress = logging.getLogger("crewnecta_qa_flow")
+    progress.addHandler(logging.StreamHandler(sys.stdout))
+    progress.setLevel(logging.INFO)
+
     # Determine transcript source
-    data_path = sys.argv[1] if len(sys.argv) > 1 else "data/mock_transcripts.json"
+    data_path = args[0] if args else "data/mock_transcripts.json"
 
     if not os.path.exists(data_path):
         print(f"Error: transcript file not found at {data_path}")
         sys.exit(1)
 
     print(f"Loading transcripts from {data_path}...")
-    transcripts = load_transcripts(data_path)
+    try:
+        transcripts = load_transcripts(data_path)
+    except ValidationError as exc:
+        print(f"Error: invalid transcripts in {data_path}:\n{exc}")
+        sys.exit(1)
     print(f"Loaded {len(transcripts)} transcripts")
 
     # Build initial state
@@ -83,9 +159,13 @@ def main() -> None:
         ],
     )
 
+    # Deterministic red-flag scans are done up front for the risk crew
+    state.red_flag_scans = scan_transcripts(transcripts)
+
     # Run the flow
     flow = QAAuditorFlow()
     flow.initial_state = state
+    flow.verbose = not quiet
     flow.kickoff()
 
     # Print results
@@ -6,9 +6,10 @@ decisions → outputs.
 """
 
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 # ---------------------------------------------------------------------------
@@ -37,6 +38,11 @@ class InteractionTranscript(BaseModel):
     customer_issue: str = ""
     resolution_status: str = ""
 
+    @cached_property
+    def transcript_text_lower(self) -> str:
+        """Lowercased transcript, computed once and shared by the scanners."""
+        return self.transcript_text.lower()
+
 
 # ---------------------------------------------------------------------------
 # Enrichment models
@@ -128,6 +134,8 @@ class QAAuditorState(BaseModel):
     compliance_requirements: list[str] = Field(default_factory=list)
 
     # --- ENRICHMENTS ---
+    # Keyword Red Flag Scanner output per interaction_id, fed to risk scoring
+    red_flag_scans: dict[str, dict] = Field(default_factory=dict)
     risk_scores: list[RiskScore] = Field(default_factory=list)
     qa_evaluations: list[QAEvaluation] = Field(default_factory=list)
     pattern_insights: list[PatternInsight] = Field(default_factory=list)
@@ -149,3 +157,27 @@ class QAAuditorState(BaseModel):
     processing_status: str = "pending"
     transcripts_processed: int = 0
     transcripts_failed: int = 0
+
+    # --- DERIVED LOOKUPS (private, not serialized) ---
+    # Rebuilt only when raw_transcripts is replaced or changes length
+    _index_key: tuple = PrivateAttr(default=())
+    _transcripts_by_id: dict = PrivateAttr(default_factory=dict)
+    _agent_names_by_id: dict = PrivateAttr(default_factory=dict)
+
+    def refresh_lookups(self) -> None:
+        """Rebuild the transcript lookups if raw_transcripts has changed."""
+        key = (id(self.raw_transcripts), len(self.raw_transcripts))
+        if key != self._index_key:
+            self._transcripts_by_id = {t.interaction_id: t for t in self.raw_transcripts}
+            self._agent_names_by_id = {t.agent_id: t.agent_name for t in self.raw_transcripts}
+            self._index_key = key
+
+    @property
+    def transcripts_by_id(self) -> dict[str, InteractionTranscript]:
+        self.refresh_lookups()
+        return self._transcripts_by_id
+
+    @property
+    def agent_names_by_id(self) -> dict[str, str]:
+        self.refresh_lookups()
+        return self._agent_names_by_id
@@ -1,4 +1,4 @@
-from .red_flag_scanner import KeywordRedFlagScanner
+from .red_flag_scanner import KeywordRedFlagScanner, scan_many
 from .scorecard_calc import QAScorecardCalculator
 from .compliance_matcher import CompliancePatternMatcher
 
@@ -13,4 +13,5 @@ __all__ = [
     "keyword_red_flag_scanner",
     "scorecard_calculator",
     "compliance_pattern_matcher",
+    "scan_many",
 ]
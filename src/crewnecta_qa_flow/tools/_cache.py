@@ -0,0 +1,45 @@
+"""Process-wide result cache for the deterministic scanner tools.
+
+The scanners are pure functions of the lowercased transcript plus their
+options, so transcripts that differ only in casing share one entry. Each
+tool module owns its own cache instance, which keeps results scoped by tool.
+Entries are keyed by a 16-byte digest of the text rather than the text
+itself, so a full cache does not pin thousands of transcripts in memory.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+
+def text_digest(text: str) -> bytes:
+    """Compact cache-key digest of a (lowercased) transcript."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class ToolResultCache:
+    """Thread-safe LRU mapping of tool inputs to serialized tool output."""
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> str | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: str) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,79 @@
+"""Multi-phrase matcher for the scanner tools.
+
+A fixed phrase library is compiled once and each scan reports every phrase
+present in the text. The fastest installed backend is used:
+
+* hyperscan — the library is compiled into a SIMD literal-matching
+  database and the text is scanned in one pass;
+* pyahocorasick — an Aho-Corasick automaton, also one pass;
+* neither — each phrase is checked with a substring test.
+
+All three give the same result.
+"""
+
+import threading
+from typing import Iterable
+
+try:
+    import hyperscan
+except ImportError:  # optional speedup
+    hyperscan = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional speedup
+    ahocorasick = None
+
+
+BACKEND = "hyperscan" if hyperscan else "ahocorasick" if ahocorasick else "substring"
+
+
+class PhraseMatcher:
+    """Finds which phrases from a fixed library occur in a text."""
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases = tuple(dict.fromkeys(phrases))
+        self._find = self._find_substrings
+        if not self.phrases:
+            return
+
+        if hyperscan is not None:
+            self._db = hyperscan.Database()
+            self._db.compile(
+                expressions=[p.encode("utf-8") for p in self.phrases],
+                ids=list(range(len(self.phrases))),
+                elements=len(self.phrases),
+                flags=hyperscan.HS_FLAG_SINGLEMATCH,
+                literal=True,
+            )
+            # Scratch space is not thread-safe, so each thread gets its own
+            self._local = threading.local()
+            self._find = self._find_hyperscan
+        elif ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for phrase in self.phrases:
+                self._automaton.add_word(phrase, phrase)
+            self._automaton.make_automaton()
+            self._find = self._find_automaton
+
+    def find(self, text: str) -> set[str]:
+        """Return the set of library phrases that occur in ``text``."""
+        return self._find(text)
+
+    def _find_hyperscan(self, text: str) -> set[str]:
+        scratch = getattr(self._local, "scratch", None)
+        if scratch is None:
+            scratch = self._local.scratch = hyperscan.Scratch(self._db)
+        ids: set[int] = set()
+
+        def on_match(id_, start, end, flags, context):
+            ids.add(id_)
+
+        self._db.scan(text.encode("utf-8"), match_event_handler=on_match, scratch=scratch)
+        return {self.phrases[i] for i in ids}
+
+    def _find_automaton(self, text: str) -> set[str]:
+        return {phrase for _, phrase in self._automaton.iter(text)}
+
+    def _find_substrings(self, text: str) -> set[str]:
+        return {phrase for phrase in self.phrases if phrase in text}
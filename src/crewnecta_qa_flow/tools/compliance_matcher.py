@@ -5,12 +5,16 @@ Checks a transcript against a library of REQUIRED regulatory phrases
 which elements were present vs. missing.
 """
 
-import json
 from typing import Type
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from crewnecta_qa_flow import _json
+from crewnecta_qa_flow.tools._cache import ToolResultCache, text_digest
+from crewnecta_qa_flow.tools._matcher import BACKEND, PhraseMatcher
+from crewnecta_qa_flow.tools.phrases import CARD_READBACK, RECORDING_DISCLOSURE
+
 
 # Each requirement set defines phrases that MUST appear and phrases that
 # must NOT appear in a compliant interaction.
@@ -18,11 +22,8 @@ REQUIREMENT_SETS: dict[str, dict] = {
     "general": {
         "must_contain": {
             "call_recording_disclosure": [
-                "call may be recorded",
-                "call is being recorded",
+                *RECORDING_DISCLOSURE,
                 "this call is recorded",
-                "for quality and training",
-                "chat is being recorded",
             ],
             "identity_verification": [
                 "verify your identity",
@@ -34,9 +35,7 @@ REQUIREMENT_SETS: dict[str, dict] = {
         },
         "must_not_contain": {
             "full_card_readback": [
-                "your card number is",
-                "card number is ",
-                "read back your card",
+                *CARD_READBACK,
                 "your full card number",
             ],
             "ssn_spoken": [
@@ -56,9 +55,7 @@ REQUIREMENT_SETS: dict[str, dict] = {
         },
         "must_not_contain": {
             "card_number_spoken": [
-                "your card number is",
-                "card number is ",
-                "read back your card",
+                *CARD_READBACK,
                 "repeat your card",
                 "full card number",
             ],
@@ -135,6 +132,35 @@ REQUIREMENT_SETS: dict[str, dict] = {
 }
 
 
+# REQUIREMENT_SETS flattened once into fixed (req_name, phrases) tuples per
+# check type, so _run does no per-call dict lookups.
+_COMPILED: dict[str, dict[str, tuple[tuple[str, tuple[str, ...]], ...]]] = {
+    name: {
+        check: tuple(
+            (req_name, tuple(phrases))
+            for req_name, phrases in reqs.get(check, {}).items()
+        )
+        for check in ("must_contain", "must_not_contain")
+    }
+    for name, reqs in REQUIREMENT_SETS.items()
+}
+
+# One Hyperscan pass per requirement set beats per-phrase substring checks;
+# Aho-Corasick does not at these set sizes, so it is not used here
+_MATCHERS: dict[str, PhraseMatcher] = (
+    {
+        name: PhraseMatcher(
+            p for check in checks.values() for _, phrases in check for p in phrases
+        )
+        for name, checks in _COMPILED.items()
+    }
+    if BACKEND == "hyperscan"
+    else {}
+)
+
+_RESULT_CACHE = ToolResultCache()
+
+
 class ComplianceMatchInput(BaseModel):
     transcript_text: str = Field(description="Transcript to check for compliance")
     requirement_set: str = Field(
@@ -153,19 +179,35 @@ class CompliancePatternMatcher(BaseTool):
     )
     args_schema: Type[BaseModel] = ComplianceMatchInput
 
-    def _run(self, transcript_text: str, requirement_set: str = "general") -> str:
-        reqs = REQUIREMENT_SETS.get(requirement_set, REQUIREMENT_SETS["general"])
-        text_lower = transcript_text.lower()
+    def _run(
+        self,
+        transcript_text: str,
+        requirement_set: str = "general",
+        transcript_text_lower: str | None = None,
+    ) -> str:
+        # Direct callers may pass the already-lowercased text (not part of
+        # the LLM-facing args_schema)
+        text_lower = transcript_text_lower or transcript_text.lower()
+        cache_key = (text_digest(text_lower), requirement_set)
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        set_name = requirement_set if requirement_set in _COMPILED else "general"
+        reqs = _COMPILED[set_name]
+        # Either the set of phrases found or the text itself; `in` works on both
+        matcher = _MATCHERS.get(set_name)
+        present = matcher.find(text_lower) if matcher else text_lower
 
         results: list[dict] = []
         total = 0
         passed = 0
 
         # Check must_contain requirements
-        for req_name, phrases in reqs.get("must_contain", {}).items():
+        for req_name, phrases in reqs["must_contain"]:
             total += 1
-            found = any(p in text_lower for p in phrases)
-            matched = [p for p in phrases if p in text_lower]
+            matched = [p for p in phrases if p in present]
+            found = bool(matched)
             if found:
                 passed += 1
             results.append({
@@ -176,9 +218,9 @@ class CompliancePatternMatcher(BaseTool):
             })
 
         # Check must_not_contain requirements
-        for req_name, phrases in reqs.get("must_not_contain", {}).items():
+        for req_name, phrases in reqs["must_not_contain"]:
             total += 1
-            violations = [p for p in phrases if p in text_lower]
+            violations = [p for p in phrases if p in present]
             is_clean = len(violations) == 0
             if is_clean:
                 passed += 1
@@ -191,7 +233,7 @@ class CompliancePatternMatcher(BaseTool):
 
         compliance_rate = round((passed / total) * 100, 1) if total > 0 else 100.0
 
-        return json.dumps(
+        output = _json.dumps(
             {
                 "requirement_set": requirement_set,
                 "total_checks": total,
@@ -200,5 +242,7 @@ class CompliancePatternMatcher(BaseTool):
                 "compliance_rate": compliance_rate,
                 "results": results,
             },
-            indent=2,
-        )
+            indent=True,
+        ).decode()
+        _RESULT_CACHE.put(cache_key, output)
+        return output
@@ -0,0 +1,22 @@
+"""Phrase groups used in more than one place by the scanner tools.
+
+The recording disclosures are checked by both the red-flag scanner and the
+compliance matcher; the card read-back phrases appear in two of the
+compliance matcher's requirement sets. Defining each group once keeps those
+lists in step.
+"""
+
+# Recording disclosures the agent is expected to give on voice/chat
+RECORDING_DISCLOSURE = (
+    "call may be recorded",
+    "call is being recorded",
+    "for quality and training",
+    "chat is being recorded",
+)
+
+# The agent reading a card number back to the customer
+CARD_READBACK = (
+    "your card number is",
+    "card number is ",
+    "read back your card",
+)
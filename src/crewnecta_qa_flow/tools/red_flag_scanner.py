@@ -5,12 +5,193 @@ Categorizes flags by type (compliance/complaint/process) and severity
 (critical/high/medium). Returns JSON with flags, risk_score, and priority.
 """
 
-import json
 from typing import Type
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from crewnecta_qa_flow import _json
+from crewnecta_qa_flow.tools._cache import ToolResultCache, text_digest
+from crewnecta_qa_flow.tools._matcher import PhraseMatcher
+from crewnecta_qa_flow.tools.phrases import RECORDING_DISCLOSURE
+
+
+# COMPLIANCE RED FLAGS (severity: critical)
+COMPLIANCE_PATTERNS: dict[str, list[str]] = {
+    "card_number_exposure": [
+        "card number is",
+        "your card number",
+        "read back",
+        "credit card",
+        "card ending in",
+        "full card",
+    ],
+    "data_handling": [
+        "social security",
+        "ssn",
+        "date of birth",
+        "mother's maiden",
+    ],
+}
+
+# COMPLAINT RED FLAGS (severity: high)
+COMPLAINT_PATTERNS: dict[str, list[str]] = {
+    "escalation_request": [
+        "speak to a manager",
+        "speak to a supervisor",
+        "transfer me to",
+        "your manager",
+        "escalate",
+        "file a complaint",
+        "formal complaint",
+    ],
+    "churn_risk": [
+        "cancel my",
+        "cancellation",
+        "switch to",
+        "competitor",
+        "leaving",
+        "done with you",
+        "never coming back",
+    ],
+    "frustration": [
+        "unacceptable",
+        "ridiculous",
+        "worst service",
+        "been waiting",
+        "third time",
+        "already told",
+        "keep repeating",
+        "waste of time",
+    ],
+}
+
+# PROCESS RED FLAGS (severity: medium)
+PROCESS_PATTERNS: dict[str, list[str]] = {
+    "hold_issues": [
+        "been on hold",
+        "long hold",
+        "holding for",
+        "waited for",
+    ],
+    "transfer_issues": [
+        "transferred again",
+        "third person",
+        "keep getting transferred",
+        "bounced around",
+    ],
+    "repeat_contact": [
+        "called before",
+        "called yesterday",
+        "already contacted",
+        "third time calling",
+        "same issue",
+    ],
+}
+
+# Recording disclosures (inverted — absence is the flag)
+DISCLOSURE_PHRASES: list[str] = list(RECORDING_DISCLOSURE)
+
+SEVERITY_WEIGHTS = {"critical": 1.0, "high": 0.7, "medium": 0.4}
+
+# Review priority by tenths of risk score: high >= 0.7, medium >= 0.4
+_PRIORITY_BY_TENTH = tuple(
+    "low" if tenth < 4 else "medium" if tenth < 7 else "high" for tenth in range(11)
+)
+
+_MATCHER = PhraseMatcher(
+    [p for patterns in COMPLIANCE_PATTERNS.values() for p in patterns]
+    + DISCLOSURE_PHRASES
+    + [p for patterns in COMPLAINT_PATTERNS.values() for p in patterns]
+    + [p for patterns in PROCESS_PATTERNS.values() for p in patterns]
+)
+
+
+_RESULT_CACHE = ToolResultCache()
+
+
+def _scan(text_lower: str, channel: str) -> dict:
+    """Scan one lowercased transcript; returns the tool's result dict."""
+    found = _MATCHER.find(text_lower)
+    flags: list[dict] = []
+
+    # Scan compliance patterns
+    for category, patterns in COMPLIANCE_PATTERNS.items():
+        for pattern in patterns:
+            if pattern in found:
+                flags.append({
+                    "type": "compliance",
+                    "category": category,
+                    "severity": "critical",
+                    "matched_pattern": pattern,
+                })
+
+    # Missing disclosure flag (only for voice/chat where it's required)
+    has_disclosure = any(p in found for p in DISCLOSURE_PHRASES)
+    if not has_disclosure and channel in ("voice", "chat"):
+        flags.append({
+            "type": "compliance",
+            "category": "missing_disclosure",
+            "severity": "critical",
+            "matched_pattern": "(no recording disclosure found)",
+        })
+
+    # Scan complaint patterns
+    for category, patterns in COMPLAINT_PATTERNS.items():
+        for pattern in patterns:
+            if pattern in found:
+                flags.append({
+                    "type": "complaint",
+                    "category": category,
+                    "severity": "high",
+                    "matched_pattern": pattern,
+                })
+
+    # Scan process patterns
+    for category, patterns in PROCESS_PATTERNS.items():
+        for pattern in patterns:
+            if pattern in found:
+                flags.append({
+                    "type": "process",
+                    "category": category,
+                    "severity": "medium",
+                    "matched_pattern": pattern,
+                })
+
+    # Calculate overall risk score. Flags are appended most severe first
+    # (compliance, complaint, process), so the first flag has the maximum.
+    if flags:
+        max_severity = SEVERITY_WEIGHTS[flags[0]["severity"]]
+        risk_score = min(1.0, max_severity + (len(flags) - 1) * 0.05)
+    else:
+        risk_score = 0.1  # Base low risk
+
+    return {
+        "flags_found": len(flags),
+        "flags": flags,
+        # risk_score is always in [0.1, 1.0], where half-up integer rounding
+        # matches round(x, 2) for every reachable value and is cheaper
+        "risk_score": int(risk_score * 100 + 0.5) / 100,
+        "priority": _PRIORITY_BY_TENTH[min(int(risk_score * 10), 10)],
+    }
+
+
+def scan_many(
+    transcripts: list[str],
+    channels: list[str],
+    lowered: bool = False,
+) -> list[dict]:
+    """Scan many transcripts in one call, bypassing tool dispatch.
+
+    Returns one result dict per transcript, in input order — the same
+    payload the tool returns as JSON. Pass ``lowered=True`` when the texts
+    are already lowercased.
+    """
+    return [
+        _scan(text if lowered else text.lower(), channel)
+        for text, channel in zip(transcripts, channels, strict=True)
+    ]
+
 
 class RedFlagInput(BaseModel):
     transcript_text: str = Field(description="The interaction transcript text to scan")
@@ -26,160 +207,20 @@ class KeywordRedFlagScanner(BaseTool):
     )
     args_schema: Type[BaseModel] = RedFlagInput
 
-    def _run(self, transcript_text: str, channel: str) -> str:
-        flags: list[dict] = []
-        text_lower = transcript_text.lower()
-
-        # COMPLIANCE RED FLAGS (severity: critical)
-        compliance_patterns = {
-            "card_number_exposure": [
-                "card number is",
-                "your card number",
-                "read back",
-                "credit card",
-                "card ending in",
-                "full card",
-            ],
-            "missing_disclosure": [
-                "call may be recorded",
-                "call is being recorded",
-                "for quality and training",
-                "chat is being recorded",
-            ],
-            "data_handling": [
-                "social security",
-                "ssn",
-                "date of birth",
-                "mother's maiden",
-            ],
-        }
-
-        # COMPLAINT RED FLAGS (severity: high)
-        complaint_patterns = {
-            "escalation_request": [
-                "speak to a manager",
-                "speak to a supervisor",
-                "transfer me to",
-                "your manager",
-                "escalate",
-                "file a complaint",
-                "formal complaint",
-            ],
-            "churn_risk": [
-                "cancel my",
-                "cancellation",
-                "switch to",
-                "competitor",
-                "leaving",
-                "done with you",
-                "never coming back",
-            ],
-            "frustration": [
-                "unacceptable",
-                "ridiculous",
-                "worst service",
-                "been waiting",
-                "third time",
-                "already told",
-                "keep repeating",
-                "waste of time",
-            ],
-        }
-
-        # PROCESS RED FLAGS (severity: medium)
-        process_patterns = {
-            "hold_issues": [
-                "been on hold",
-                "long hold",
-                "holding for",
-                "waited for",
-            ],
-            "transfer_issues": [
-                "transferred again",
-                "third person",
-                "keep getting transferred",
-                "bounced around",
-            ],
-            "repeat_contact": [
-                "called before",
-                "called yesterday",
-                "already contacted",
-                "third time calling",
-                "same issue",
-            ],
-        }
-
-        # Check for missing disclosure (inverted — absence is the flag)
-        disclosure_phrases = [
-            "call may be recorded",
-            "call is being recorded",
-            "for quality and training",
-            "chat is being recorded",
-        ]
-        has_disclosure = any(p in text_lower for p in disclosure_phrases)
-
-        # Scan compliance patterns
-        for category, patterns in compliance_patterns.items():
-            if category == "missing_disclosure":
-                continue  # handled separately below
-            for pattern in patterns:
-                if pattern in text_lower:
-                    flags.append({
-                        "type": "compliance",
-                        "category": category,
-                        "severity": "critical",
-                        "matched_pattern": pattern,
-                    })
-
-        # Missing disclosure flag (only for voice/chat where it's required)
-        if not has_disclosure and channel in ("voice", "chat"):
-            flags.append({
-                "type": "compliance",
-                "category": "missing_disclosure",
-                "severity": "critical",
-                "matched_pattern": "(no recording disclosure found)",
-            })
-
-        # Scan complaint patterns
-        for category, patterns in complaint_patterns.items():
-            for pattern in patterns:
-                if pattern in text_lower:
-                    flags.append({
-                        "type": "complaint",
-                        "category": category,
-                        "severity": "high",
-                        "matched_pattern": pattern,
-                    })
-
-        # Scan process patterns
-        for category, patterns in process_patterns.items():
-            for pattern in patterns:
-                if pattern in text_lower:
-                    flags.append({
-                        "type": "process",
-                        "category": category,
-                        "severity": "medium",
-                        "matched_pattern": pattern,
-                    })
-
-        # Calculate overall risk score
-        severity_weights = {"critical": 1.0, "high": 0.7, "medium": 0.4}
-        if flags:
-            max_severity = max(severity_weights[f["severity"]] for f in flags)
-            risk_score = min(1.0, max_severity + (len(flags) - 1) * 0.05)
-        else:
-            risk_score = 0.1  # Base low risk
-
-        return json.dumps(
-            {
-                "flags_found": len(flags),
-                "flags": flags,
-                "risk_score": round(risk_score, 2),
-                "priority": (
-                    "high" if risk_score >= 0.7
-                    else "medium" if risk_score >= 0.4
-                    else "low"
-                ),
-            },
-            indent=2,
-        )
+    def _run(
+        self,
+        transcript_text: str,
+        channel: str,
+        transcript_text_lower: str | None = None,
+    ) -> str:
+        # Direct callers may pass the already-lowercased text (not part of
+        # the LLM-facing args_schema)
+        text_lower = transcript_text_lower or transcript_text.lower()
+        cache_key = (text_digest(text_lower), channel)
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        output = _json.dumps(_scan(text_lower, channel), indent=True).decode()
+        _RESULT_CACHE.put(cache_key, output)
+        return output
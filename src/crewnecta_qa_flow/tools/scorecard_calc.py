@@ -5,12 +5,15 @@ produce a final overall QA score. Different BPO clients weight compliance
 vs. empathy vs. resolution differently.
 """
 
-import json
+from bisect import bisect_right
 from typing import Type
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from crewnecta_qa_flow import _json
+from crewnecta_qa_flow.tools._cache import ToolResultCache
+
 
 WEIGHT_PROFILES = {
     "standard": {
@@ -33,6 +36,20 @@ WEIGHT_PROFILES = {
     },
 }
 
+DIMENSIONS = ("compliance", "empathy", "resolution", "process_adherence")
+
+# Per-profile (dimension, weight) pairs, resolved once at import
+_PROFILE_WEIGHTS: dict[str, tuple[tuple[str, float], ...]] = {
+    name: tuple((dim, weights[dim]) for dim in DIMENSIONS)
+    for name, weights in WEIGHT_PROFILES.items()
+}
+
+# Performance bands, indexed by how many thresholds the overall score reaches
+_BAND_THRESHOLDS = (60, 75, 90)
+_BANDS = ("critical", "needs_improvement", "meets_expectations", "exceeds_expectations")
+
+_RESULT_CACHE = ToolResultCache()
+
 
 class ScorecardInput(BaseModel):
     compliance_score: float = Field(description="Compliance score 0-100")
@@ -63,31 +80,24 @@ class QAScorecardCalculator(BaseTool):
         process_adherence_score: float,
         weight_profile: str = "standard",
     ) -> str:
-        weights = WEIGHT_PROFILES.get(weight_profile, WEIGHT_PROFILES["standard"])
+        # Coerced as args_schema does, so 82 and 82.0 share one cached output
+        scores = tuple(map(float, (
+            compliance_score, empathy_score, resolution_score, process_adherence_score,
+        )))
+        cache_key = (scores, weight_profile)
+        cached = _RESULT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        weights = _PROFILE_WEIGHTS.get(weight_profile, _PROFILE_WEIGHTS["standard"])
 
         breakdown = {
-            "compliance": {
-                "raw_score": compliance_score,
-                "weight": weights["compliance"],
-                "weighted_score": round(compliance_score * weights["compliance"], 2),
-            },
-            "empathy": {
-                "raw_score": empathy_score,
-                "weight": weights["empathy"],
-                "weighted_score": round(empathy_score * weights["empathy"], 2),
-            },
-            "resolution": {
-                "raw_score": resolution_score,
-                "weight": weights["resolution"],
-                "weighted_score": round(resolution_score * weights["resolution"], 2),
-            },
-            "process_adherence": {
-                "raw_score": process_adherence_score,
-                "weight": weights["process_adherence"],
-                "weighted_score": round(
-                    process_adherence_score * weights["process_adherence"], 2
-                ),
-            },
+            dim: {
+                "raw_score": score,
+                "weight": weight,
+                "weighted_score": round(score * weight, 2),
+            }
+            for (dim, weight), score in zip(weights, scores)
         }
 
         overall = round(
@@ -95,21 +105,16 @@ class QAScorecardCalculator(BaseTool):
         )
 
         # Performance band
-        if overall >= 90:
-            band = "exceeds_expectations"
-        elif overall >= 75:
-            band = "meets_expectations"
-        elif overall >= 60:
-            band = "needs_improvement"
-        else:
-            band = "critical"
-
-        return json.dumps(
+        band = _BANDS[bisect_right(_BAND_THRESHOLDS, overall)]
+
+        output = _json.dumps(
             {
                 "overall_score": overall,
                 "performance_band": band,
                 "weight_profile_used": weight_profile,
                 "breakdown": breakdown,
             },
-            indent=2,
-        )
+            indent=True,
+        ).decode()
+        _RESULT_CACHE.put(cache_key, output)
+        return output
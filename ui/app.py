@@ -3,11 +3,14 @@
 Live run mode: triggers the full flow and displays results in real-time.
 """
 
-import json
+import logging
 import os
 import sys
+from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
@@ -18,7 +21,10 @@ if project_root not in sys.path:
     sys.path.insert(0, os.path.join(project_root, "src"))
 
 from dotenv import load_dotenv
+from pydantic import TypeAdapter
 
+from crewnecta_qa_flow import _json
+from crewnecta_qa_flow.crews._cache import fresh_responses
 from crewnecta_qa_flow.state.models import (
     ComplianceSeverity,
     InteractionTranscript,
@@ -28,6 +34,13 @@ from crewnecta_qa_flow.flow.qa_auditor_flow import QAAuditorFlow
 
 load_dotenv()
 
+# Flow progress is logged at INFO; show it in the server console, as the CLI
+# does on stdout. Streamlit reruns this script, so the handler is added once
+progress_log = logging.getLogger("crewnecta_qa_flow")
+if not progress_log.handlers:
+    progress_log.addHandler(logging.StreamHandler(sys.stdout))
+    progress_log.setLevel(logging.INFO)
+
 # ---------------------------------------------------------------------------
 # Page config
 # ---------------------------------------------------------------------------
@@ -46,19 +59,22 @@ st.caption("AI-powered BPO quality assurance and coaching engine")
 # Helpers
 # ---------------------------------------------------------------------------
 def load_transcripts_from_file(file_path: str) -> list[dict]:
-    with open(file_path, "r") as f:
-        data = json.load(f)
+    data = _json.loads(Path(file_path).read_bytes())
     return data.get("transcripts", data) if isinstance(data, dict) else data
 
 
 def load_transcripts_from_upload(uploaded) -> list[dict]:
-    data = json.loads(uploaded.read())
+    data = _json.loads(uploaded.getvalue())
     return data.get("transcripts", data) if isinstance(data, dict) else data
 
 
-def run_flow(transcripts_raw: list[dict]) -> QAAuditorState:
+# Validates a whole transcript list in one pydantic-core call
+_TRANSCRIPTS_ADAPTER = TypeAdapter(list[InteractionTranscript])
+
+
+def _execute_flow(transcripts_json: bytes) -> QAAuditorState:
     """Run the full QA auditor flow and return final state."""
-    transcripts = [InteractionTranscript(**t) for t in transcripts_raw]
+    transcripts = _TRANSCRIPTS_ADAPTER.validate_json(transcripts_json)
 
     state = QAAuditorState(
         raw_transcripts=transcripts,
@@ -78,6 +94,48 @@ def run_flow(transcripts_raw: list[dict]) -> QAAuditorState:
     return flow.state
 
 
+class _IncompleteRun(Exception):
+    """Carries the state of a run that finished with errors, past the cache."""
+
+    def __init__(self, state: QAAuditorState):
+        super().__init__(f"{len(state.errors)} error(s)")
+        self.state = state
+
+
+# Resource cache (not cache_data): the flow returns a CrewAI-generated state
+# subclass that does not survive a pickle/JSON round trip, and the UI only
+# reads the state, so sharing the cached object is safe
+@st.cache_resource(ttl=24 * 60 * 60, max_entries=32, show_spinner=False)
+def _run_flow_cached(transcripts_json: bytes) -> QAAuditorState:
+    state = _execute_flow(transcripts_json)
+    # The flow turns LLM/provider failures into errors plus fallback values.
+    # Raising keeps such a run out of the cache, which every session shares
+    if state.errors or state.transcripts_failed:
+        raise _IncompleteRun(state)
+    return state
+
+
+def run_flow(transcripts_json: bytes, refresh: bool = False) -> QAAuditorState:
+    """Run the QA auditor flow, reusing a clean earlier run of the same input.
+
+    Only runs that finished without errors are cached. ``refresh`` drops any
+    cached run for this input and bypasses the per-kickoff response cache,
+    so every step asks the model again.
+    """
+    if not refresh:
+        try:
+            return _run_flow_cached(transcripts_json)
+        except _IncompleteRun as incomplete:
+            return incomplete.state
+
+    _run_flow_cached.clear(transcripts_json)
+    with fresh_responses():
+        try:
+            return _run_flow_cached(transcripts_json)
+        except _IncompleteRun as incomplete:
+            return incomplete.state
+
+
 # ---------------------------------------------------------------------------
 # Sidebar — Input
 # ---------------------------------------------------------------------------
@@ -111,17 +169,32 @@ with st.sidebar:
         disabled=transcripts_raw is None,
         use_container_width=True,
     )
+    rerun_btn = st.button(
+        "Re-run (ignore cache)",
+        disabled=transcripts_raw is None,
+        use_container_width=True,
+        help="Repeat every step and ask the model again, without reusing "
+        "cached runs or cached model responses",
+    )
 
 # ---------------------------------------------------------------------------
 # Main area
 # ---------------------------------------------------------------------------
-if run_btn and transcripts_raw:
+if (run_btn or rerun_btn) and transcripts_raw:
     with st.status("Running QA Audit Flow...", expanded=True) as status:
         st.write("Step 1/7: Risk scoring all transcripts...")
-        state = run_flow(transcripts_raw)
-        status.update(label="QA Audit Complete!", state="complete", expanded=False)
+        state = run_flow(_json.dumps(transcripts_raw), refresh=rerun_btn)
+        if state.errors or state.transcripts_failed:
+            status.update(
+                label="QA Audit finished with errors — result not cached",
+                state="error",
+                expanded=False,
+            )
+        else:
+            status.update(label="QA Audit Complete!", state="complete", expanded=False)
 
     st.session_state["state"] = state
+    st.session_state.pop("state_json", None)  # serialized lazily by Raw Data
 
 if "state" not in st.session_state:
     st.info("Configure input in the sidebar and click **Run QA Audit** to start.")
@@ -130,20 +203,13 @@ if "state" not in st.session_state:
 state: QAAuditorState = st.session_state["state"]
 
 # ---------------------------------------------------------------------------
-# Tabs
+# Views — one render function per view; only the selected one runs. Each is
+# a fragment, so a widget inside a view (e.g. the Raw Data download button)
+# reruns just that view instead of the whole script
 # ---------------------------------------------------------------------------
-tabs = st.tabs([
-    "Overview",
-    "Risk Scores",
-    "Agent Scores",
-    "Compliance",
-    "Patterns",
-    "Coaching",
-    "Raw Data",
-])
-
-# ---- Overview Tab ----
-with tabs[0]:
+# ---- Overview ----
+@st.fragment
+def render_overview(state: QAAuditorState) -> None:
     st.header("Executive Summary")
 
     col1, col2, col3, col4 = st.columns(4)
@@ -169,79 +235,89 @@ with tabs[0]:
             for err in state.errors:
                 st.warning(err)
 
-# ---- Risk Scores Tab ----
-with tabs[1]:
+
+# ---- Risk Scores ----
+PRIORITY_LEVELS = ("low", "medium", "high")
+PRIORITY_COLORS = {"high": "#ef4444", "medium": "#f59e0b", "low": "#22c55e"}
+
+
+# px.bar costs ~50ms; a cache hit (unpickling the figure) about a fifth of
+# that. The radar is cheaper to rebuild than to unpickle, so is not cached
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_risk_bar(risk_df: pd.DataFrame) -> go.Figure:
+    fig = px.bar(
+        risk_df,
+        x="Interaction",
+        y="Risk Score",
+        color="Priority",
+        color_discrete_map=PRIORITY_COLORS,
+        title="Risk Scores by Interaction",
+        hover_data=["Factors"],
+    )
+    fig.update_layout(yaxis_range=[0, 1.05])
+    return fig
+
+
+@st.fragment
+def render_risk_scores(state: QAAuditorState) -> None:
     st.header("Risk Score Distribution")
 
     if state.risk_scores:
-        risk_data = [
-            {
-                "Interaction": rs.interaction_id,
-                "Risk Score": rs.risk_score,
-                "Priority": rs.priority_for_review,
-                "Factors": ", ".join(rs.risk_factors[:3]),
-            }
-            for rs in state.risk_scores
-        ]
-
-        color_map = {"high": "#ef4444", "medium": "#f59e0b", "low": "#22c55e"}
-        fig = px.bar(
-            risk_data,
-            x="Interaction",
-            y="Risk Score",
-            color="Priority",
-            color_discrete_map=color_map,
-            title="Risk Scores by Interaction",
-            hover_data=["Factors"],
-        )
-        fig.update_layout(yaxis_range=[0, 1.05])
-        st.plotly_chart(fig, use_container_width=True)
-
-        st.dataframe(risk_data, use_container_width=True)
+        # One columnar frame for both the chart and the table. Priority is
+        # categorical (known levels first, any unexpected ones kept after)
+        scores = state.risk_scores
+        priorities = [rs.priority_for_review for rs in scores]
+        risk_df = pd.DataFrame({
+            "Interaction": [rs.interaction_id for rs in scores],
+            "Risk Score": np.fromiter(
+                (rs.risk_score for rs in scores), dtype=np.float32, count=len(scores)
+            ),
+            "Priority": pd.Categorical(
+                priorities,
+                categories=list(dict.fromkeys([*PRIORITY_LEVELS, *priorities])),
+            ),
+            "Factors": [", ".join(rs.risk_factors[:3]) for rs in scores],
+        })
+
+        st.plotly_chart(build_risk_bar(risk_df), use_container_width=True)
+
+        st.dataframe(risk_df, use_container_width=True)
     else:
         st.info("No risk scores available.")
 
-# ---- Agent Scores Tab ----
-with tabs[2]:
+
+# ---- Agent Scores ----
+@st.fragment
+def render_agent_scores(state: QAAuditorState) -> None:
     st.header("Per-Agent Score Breakdown")
 
     if state.qa_evaluations:
-        # Group evaluations by agent
-        agent_scores: dict[str, dict] = {}
+        # Group evaluations by agent in one pass
+        evals_by_agent: dict[str, list] = defaultdict(list)
         for ev in state.qa_evaluations:
-            aid = ev.agent_id
-            if aid not in agent_scores:
-                agent_scores[aid] = {
-                    "compliance": [],
-                    "empathy": [],
-                    "resolution": [],
-                    "process": [],
-                }
-            agent_scores[aid]["compliance"].append(ev.compliance_score)
-            agent_scores[aid]["empathy"].append(ev.empathy_score)
-            agent_scores[aid]["resolution"].append(ev.resolution_score)
-            agent_scores[aid]["process"].append(ev.process_adherence_score)
-
-        # Get agent names
-        agent_names = {}
-        for t in state.raw_transcripts:
-            agent_names[t.agent_id] = t.agent_name
+            evals_by_agent[ev.agent_id].append(ev)
+
+        agent_names = state.agent_names_by_id
 
         # Radar chart per agent
         categories = ["Compliance", "Empathy", "Resolution", "Process"]
         fig = go.Figure()
 
-        for aid, scores in agent_scores.items():
+        for aid, agent_evals in evals_by_agent.items():
+            n = len(agent_evals)
             avg_vals = [
-                sum(scores["compliance"]) / len(scores["compliance"]),
-                sum(scores["empathy"]) / len(scores["empathy"]),
-                sum(scores["resolution"]) / len(scores["resolution"]),
-                sum(scores["process"]) / len(scores["process"]),
+                sum(e.compliance_score for e in agent_evals) / n,
+                sum(e.empathy_score for e in agent_evals) / n,
+                sum(e.resolution_score for e in agent_evals) / n,
+                sum(e.process_adherence_score for e in agent_evals) / n,
             ]
             name = agent_names.get(aid, aid)
             fig.add_trace(
                 go.Scatterpolar(
-                    r=avg_vals + [avg_vals[0]],  # close the polygon
+                    # Repeat the first value to close the polygon. An array (not
+                    # a list) ships to the browser as a typed buffer; kept
+                    # float64 so the hover values show no float32 rounding noise
+                    r=np.array(avg_vals + [avg_vals[0]], dtype=np.float64),
                     theta=categories + [categories[0]],
                     fill="toself",
                     name=f"{name} ({aid})",
@@ -256,10 +332,9 @@ with tabs[2]:
         st.plotly_chart(fig, use_container_width=True)
 
         # Per-agent detail table
-        for aid, scores in agent_scores.items():
+        for aid, agent_evals in evals_by_agent.items():
             name = agent_names.get(aid, aid)
             with st.expander(f"{name} ({aid})"):
-                agent_evals = [e for e in state.qa_evaluations if e.agent_id == aid]
                 for ev in agent_evals:
                     st.markdown(f"**{ev.interaction_id}** — Overall: {ev.overall_score}")
                     c1, c2, c3, c4 = st.columns(4)
@@ -275,21 +350,30 @@ with tabs[2]:
     else:
         st.info("No evaluations available.")
 
-# ---- Compliance Tab ----
-with tabs[3]:
+
+# ---- Compliance ----
+SEVERITY_BADGES = {
+    ComplianceSeverity.CRITICAL: "🔴 CRITICAL",
+    ComplianceSeverity.MAJOR: "🟠 MAJOR",
+    ComplianceSeverity.MINOR: "🟡 MINOR",
+    ComplianceSeverity.NONE: "🟢 NONE",
+}
+# Enum members are declared most severe first
+SEVERITY_ORDER = {sev: i for i, sev in enumerate(ComplianceSeverity)}
+
+
+@st.fragment
+def render_compliance(state: QAAuditorState) -> None:
     st.header("Compliance Overview")
 
     if state.qa_evaluations:
-        for ev in state.qa_evaluations:
-            severity = ev.compliance_severity.value
-            if severity == "critical":
-                badge = "🔴 CRITICAL"
-            elif severity == "major":
-                badge = "🟠 MAJOR"
-            elif severity == "minor":
-                badge = "🟡 MINOR"
-            else:
-                badge = "🟢 NONE"
+        # Most severe first; the sort is stable, so run order is kept within a level
+        evals = sorted(
+            state.qa_evaluations,
+            key=lambda e: SEVERITY_ORDER[e.compliance_severity],
+        )
+        for ev in evals:
+            badge = SEVERITY_BADGES[ev.compliance_severity]
 
             with st.expander(f"{badge} — {ev.interaction_id} (Agent: {ev.agent_id})"):
                 st.metric("Compliance Score", f"{ev.compliance_score:.0f}/100")
@@ -307,42 +391,59 @@ with tabs[3]:
     else:
         st.info("No compliance data available.")
 
-# ---- Patterns Tab ----
-with tabs[4]:
+
+# ---- Patterns ----
+PATTERN_COLORS = {
+    "agent_specific": "blue",
+    "systemic": "red",
+    "script_issue": "orange",
+    "training_gap": "violet",
+}
+
+
+@st.fragment
+def render_patterns(state: QAAuditorState) -> None:
     st.header("Pattern Insights")
 
     if state.pattern_insights:
         for p in state.pattern_insights:
-            type_colors = {
-                "agent_specific": "blue",
-                "systemic": "red",
-                "script_issue": "orange",
-                "training_gap": "violet",
-            }
-            color = type_colors.get(p.pattern_type, "gray")
+            color = PATTERN_COLORS.get(p.pattern_type, "gray")
 
             with st.container(border=True):
-                st.markdown(f":{color}[**{p.pattern_type.upper()}**]")
-                st.markdown(f"**{p.description}**")
-                st.markdown(f"Affected agents: {', '.join(p.affected_agents)}")
-                st.markdown(f"Frequency: {p.frequency}")
-                st.markdown(f"Evidence: {', '.join(p.evidence_interaction_ids)}")
+                # One element per card rather than one per line
+                st.markdown(
+                    f":{color}[**{p.pattern_type.upper()}**]\n\n"
+                    f"**{p.description}**\n\n"
+                    f"Affected agents: {', '.join(p.affected_agents)}\n\n"
+                    f"Frequency: {p.frequency}\n\n"
+                    f"Evidence: {', '.join(p.evidence_interaction_ids)}"
+                )
                 st.info(f"Recommended: {p.recommended_action}")
     else:
         st.info("No patterns detected.")
 
-# ---- Coaching Tab ----
-with tabs[5]:
+
+# ---- Coaching ----
+PERFORMANCE_ICONS = {
+    "exceeds": "🌟",
+    "meets": "✅",
+    "below": "⚠️",
+    "critical": "🚨",
+}
+
+
+def markdown_list(title: str, items: list[str]) -> str:
+    """One markdown block: a bold title over a bullet list of ``items``."""
+    return f"**{title}:**\n\n" + "\n".join(f"- {item}" for item in items)
+
+
+@st.fragment
+def render_coaching(state: QAAuditorState) -> None:
     st.header("Coaching Plans")
 
     if state.coaching_plans:
         for cp in state.coaching_plans:
-            perf_icon = {
-                "exceeds": "🌟",
-                "meets": "✅",
-                "below": "⚠️",
-                "critical": "🚨",
-            }.get(cp.overall_performance, "❓")
+            perf_icon = PERFORMANCE_ICONS.get(cp.overall_performance, "❓")
 
             with st.expander(
                 f"{perf_icon} {cp.agent_name} ({cp.agent_id}) — {cp.overall_performance.upper()}"
@@ -350,39 +451,71 @@ with tabs[5]:
                 st.markdown(f"**Follow-up:** {cp.follow_up_timeline}")
 
                 col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown("**Key Strengths:**")
-                    for s in cp.key_strengths:
-                        st.markdown(f"- {s}")
-
-                with col2:
-                    st.markdown("**Priority Improvements:**")
-                    for imp in cp.priority_improvements:
-                        st.markdown(f"- {imp}")
+                col1.markdown(markdown_list("Key Strengths", cp.key_strengths))
+                col2.markdown(markdown_list("Priority Improvements", cp.priority_improvements))
 
+                sections = []
                 if cp.specific_examples:
-                    st.markdown("**Specific Examples:**")
-                    for ex in cp.specific_examples:
-                        st.markdown(f"> {ex}")
-
+                    sections.append(
+                        "**Specific Examples:**\n\n"
+                        + "\n\n".join(f"> {ex}" for ex in cp.specific_examples)
+                    )
                 if cp.suggested_training:
-                    st.markdown("**Suggested Training:**")
-                    for t in cp.suggested_training:
-                        st.markdown(f"- {t}")
+                    sections.append(markdown_list("Suggested Training", cp.suggested_training))
+                if sections:
+                    st.markdown("\n\n".join(sections))
     else:
         st.info("No coaching plans generated.")
 
-# ---- Raw Data Tab ----
-with tabs[6]:
+
+# ---- Raw Data ----
+# The interactive JSON tree is re-parsed and laid out in the browser, which
+# stalls on large audits; above this size only a plain-text head is shown
+JSON_VIEW_MAX_CHARS = 512 * 1024
+JSON_PREVIEW_CHARS = 16 * 1024
+
+
+@st.fragment
+def render_raw_data(state: QAAuditorState) -> None:
     st.header("Full State (JSON)")
 
-    state_json = state.model_dump(mode="json")
-    st.json(state_json)
+    # One pass through pydantic-core per audit, kept for later reruns;
+    # st.json takes the string as-is
+    state_json = st.session_state.get("state_json")
+    if state_json is None:
+        state_json = st.session_state["state_json"] = state.model_dump_json(indent=2)
+
+    if len(state_json) > JSON_VIEW_MAX_CHARS:
+        st.info(
+            f"State is {len(state_json) / 1024:.0f} KB — showing the start only. "
+            "Use the download button for the full JSON."
+        )
+        st.code(state_json[:JSON_PREVIEW_CHARS] + "\n…", language="json")
+    else:
+        st.json(state_json)
 
     st.download_button(
         label="Download Full State (JSON)",
-        data=json.dumps(state_json, indent=2, default=str),
+        data=state_json,
         file_name="qa_audit_results.json",
         mime="application/json",
         use_container_width=True,
     )
+
+
+# ---------------------------------------------------------------------------
+# View selector
+# ---------------------------------------------------------------------------
+VIEWS = {
+    "Overview": render_overview,
+    "Risk Scores": render_risk_scores,
+    "Agent Scores": render_agent_scores,
+    "Compliance": render_compliance,
+    "Patterns": render_patterns,
+    "Coaching": render_coaching,
+    "Raw Data": render_raw_data,
+}
+
+# A radio rather than st.tabs: tabs execute every body on each rerun
+view = st.radio("View", list(VIEWS), horizontal=True, key="active_tab")
+VIEWS[view](state)